@@ -1,24 +1,78 @@
 # main.py
 from fastapi import FastAPI, HTTPException, Query, Depends
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from uuid import uuid4
+import logging
 import os
-from sqlalchemy import create_engine, Column, Integer, String
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from fastapi.middleware.cors import CORSMiddleware
+import time
+import orjson
+from sqlalchemy import (
+    Column, Computed, Index, Integer, String,
+    bindparam, delete, event, func, insert, lambda_stmt, literal, or_, select, update
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+from fastapi_cache import FastAPICache
+from fastapi_cache.coder import JsonCoder
+from fastapi_cache.backends import Backend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from redis import asyncio as aioredis
+
+logger = logging.getLogger(__name__)
 
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./speed_cameras.db")
 
-# Fix for Render PostgreSQL URL format
+# Fix for Render PostgreSQL URL format, and select the async drivers
 if DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
-
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+asyncpg://", 1)
+elif DATABASE_URL.startswith("postgresql://"):
+    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+elif DATABASE_URL.startswith("sqlite://"):
+    DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+# Response cache for the read endpoints; falls back to in-process memory without Redis
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_EXPIRE_SECONDS = 300
+CACHE_MAX_ENTRIES = 1024
+
+if DATABASE_URL.startswith("sqlite"):
+    if make_url(DATABASE_URL).database in (None, "", ":memory:"):
+        # In-memory SQLite lives inside one connection, so every session has to share it
+        engine = create_async_engine(DATABASE_URL, poolclass=StaticPool)
+    else:
+        # File SQLite: keep the default pool so each session gets its own connection and transaction
+        engine = create_async_engine(DATABASE_URL)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers on other pooled connections don't block the writer, and relax fsync to checkpoints"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+else:
+    # PostgreSQL: size the pool for concurrent load and recycle idle-killed connections
+    engine = create_async_engine(
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800
+    )
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 Base = declarative_base()
 
 
@@ -33,46 +87,46 @@ class CameraDB(Base):
     zipcode = Column(String(5), nullable=False, index=True)
     speed_limit = Column(Integer, nullable=False)
     direction = Column(String(2), nullable=False)
+    # Lowercased copies of the cross streets, stored by the database, for case-insensitive search
+    cross_street_1_lc = Column(String, Computed("lower(cross_street_1)", persisted=True))
+    cross_street_2_lc = Column(String, Computed("lower(cross_street_2)", persisted=True))
+
+    __table_args__ = (
+        # One camera per intersection; also serves the duplicate lookup as a single index probe
+        Index("uq_camera_intersection", "zipcode", "cross_street_1", "cross_street_2", unique=True),
+        # Trigram indexes let PostgreSQL serve the LIKE '%street%' search from an index
+        Index(
+            "ix_cameras_cs1_lc_trgm", "cross_street_1_lc",
+            postgresql_using="gin", postgresql_ops={"cross_street_1_lc": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_cameras_cs2_lc_trgm", "cross_street_2_lc",
+            postgresql_using="gin", postgresql_ops={"cross_street_2_lc": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Pydantic Models
+Direction = Literal["N", "S", "E", "W", "NE", "NW", "SE", "SW"]
+ZipCode = Annotated[str, StringConstraints(pattern=r"^\d{5}$")]
 
 
-# Pydantic Models
 class CameraCreate(BaseModel):
     """Schema for creating a new camera"""
     cross_street_1: str = Field(..., min_length=1, max_length=100, examples=["5th Ave"])
     cross_street_2: str = Field(..., min_length=1, max_length=100, examples=["W 42nd St"])
-    zipcode: str = Field(..., pattern=r"^\d{5}$", examples=["10001"])
+    zipcode: ZipCode = Field(..., examples=["10001"])
     speed_limit: int = Field(..., ge=5, le=85, examples=[25])
-    direction: str = Field(..., examples=["N"])
-
-    @field_validator('direction')
-    @classmethod
-    def validate_direction(cls, v: str) -> str:
-        valid_directions = ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']
-        if v not in valid_directions:
-            raise ValueError(f'Direction must be one of {valid_directions}')
-        return v
+    direction: Direction = Field(..., examples=["N"])
 
 
 class CameraUpdate(BaseModel):
-    """Schema for updating an existing camera"""
-    cross_street_1: Optional[str] = Field(None, min_length=1, max_length=100, examples=["5th Ave"])
-    cross_street_2: Optional[str] = Field(None, min_length=1, max_length=100, examples=["W 42nd St"])
-    zipcode: Optional[str] = Field(None, pattern=r"^\d{5}$", examples=["10001"])
-    speed_limit: Optional[int] = Field(None, ge=5, le=85, examples=[25])
-    direction: Optional[str] = Field(None, examples=["N"])
-
-    @field_validator('direction')
-    @classmethod
-    def validate_direction(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            valid_directions = ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']
-            if v not in valid_directions:
-                raise ValueError(f'Direction must be one of {valid_directions}')
-        return v
+    """Schema for updating an existing camera; omitted fields are left as they are, and null is rejected"""
+    cross_street_1: str = Field(None, min_length=1, max_length=100, examples=["5th Ave"])
+    cross_street_2: str = Field(None, min_length=1, max_length=100, examples=["W 42nd St"])
+    zipcode: ZipCode = Field(None, examples=["10001"])
+    speed_limit: int = Field(None, ge=5, le=85, examples=[25])
+    direction: Direction = Field(None, examples=["N"])
 
 
 class Camera(BaseModel):
@@ -87,6 +141,139 @@ class Camera(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# Columns selected by the read endpoints, in response field order
+CAMERA_COLUMNS = (
+    CameraDB.id,
+    CameraDB.cross_street_1,
+    CameraDB.cross_street_2,
+    CameraDB.zipcode,
+    CameraDB.speed_limit,
+    CameraDB.direction,
+)
+
+# Camera lookup by ID, built once so its compiled SQL is reused by every request
+CAMERA_BY_ID = lambda_stmt(lambda: select(CameraDB).where(CameraDB.id == bindparam("camera_id")))
+
+
+class CameraPage(BaseModel):
+    """Schema for a page of cameras, ordered by ID"""
+    items: List[Camera]
+    next: Optional[int] = Field(None, description="Pass as after_id to fetch the next page; null on the last page")
+
+
+class CameraListResponse(JSONResponse):
+    """JSON response for camera data that is already in response shape, rendered with orjson"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+class RawJSONCoder(JsonCoder):
+    """Cache coder that serves cached JSON bytes as-is instead of decoding and re-validating them"""
+
+    @classmethod
+    def decode_as_type(cls, value, *, type_):
+        return Response(value, media_type="application/json")
+
+
+class BoundedInMemoryBackend(Backend):
+    """
+    In-process cache backend holding at most max_entries expiring keys, evicting the least recently used.
+
+    Keys set without an expiry (the per-zipcode cache versions) are kept apart and never evicted.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._store: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._pinned: Dict[str, bytes] = {}
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        if key in self._pinned:
+            return -1, self._pinned[key]
+        entry = self._store.get(key)
+        if entry is None:
+            return 0, None
+        value, expires_at = entry
+        ttl = expires_at - time.monotonic()
+        if ttl <= 0:
+            del self._store[key]
+            return 0, None
+        self._store.move_to_end(key)
+        return int(ttl), value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return (await self.get_with_ttl(key))[1]
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        if not expire:
+            self._pinned[key] = value
+            return
+        self._store[key] = (value, time.monotonic() + expire)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        if namespace:
+            keys = [k for k in (*self._store, *self._pinned) if k.startswith(namespace)]
+        else:
+            keys = [key] if key else []
+        for k in keys:
+            self._store.pop(k, None)
+            self._pinned.pop(k, None)
+        return len(keys)
+
+
+# Set up the response cache on startup; schema and sample data are handled by seed.py
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the response cache on startup and release DB connections on shutdown"""
+    if REDIS_URL:
+        FastAPICache.init(RedisBackend(aioredis.from_url(REDIS_URL)), prefix="cams", coder=RawJSONCoder)
+    else:
+        FastAPICache.init(BoundedInMemoryBackend(CACHE_MAX_ENTRIES), prefix="cams", coder=RawJSONCoder)
+
+    yield
+    await engine.dispose()
+
+
+# CORS headers are fixed (any origin, no credentials), so they are built once
+CORS_ALLOW_ORIGIN_HEADER = (b"access-control-allow-origin", b"*")
+CORS_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Max-Age": "600",
+}
+
+
+class StaticCORSMiddleware:
+    """ASGI middleware that answers CORS preflights and tags responses with a fixed allow-origin header"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            response = Response(status_code=204, headers=CORS_PREFLIGHT_HEADERS)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), CORS_ALLOW_ORIGIN_HEADER]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
 # FastAPI app
 app = FastAPI(
     title="Speed Camera API",
@@ -94,189 +281,175 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan
 )
 
 # CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(StaticCORSMiddleware)
+
+# Compress larger JSON responses (camera lists)
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Cached pages are keyed under their zipcode's current version, so a write only has to bump that
+# version; pages under the old version are never read again and age out (or are evicted)
+def cache_version_key(zipcode: str) -> str:
+    """Cache key holding the current version of a zipcode's cached pages"""
+    return f"{FastAPICache.get_prefix()}:v:{zipcode}"
+
+
+async def cache_version(zipcode: str) -> str:
+    """Current version of a zipcode's cached pages"""
+    try:
+        version = await FastAPICache.get_backend().get(cache_version_key(zipcode))
+    except Exception:
+        logger.warning("Failed to read the cache version for zipcode %s", zipcode, exc_info=True)
+        # Unknown version: use a throwaway one so a stale page can't be served
+        return uuid4().hex
+    return version.decode() if version else "0"
+
+
+async def zipcode_cache_key(func, namespace, *, request=None, response=None, args, kwargs):
+    """Cache key for a page of cameras by zipcode"""
+    zipcode = kwargs["zipcode"]
+    return (
+        f"{FastAPICache.get_prefix()}:{zipcode}:{await cache_version(zipcode)}:z:"
+        f"{kwargs['limit']}:{kwargs['after_id']}"
+    )
+
+
+async def search_cache_key(func, namespace, *, request=None, response=None, args, kwargs):
+    """Cache key for a page of cameras by street and zipcode"""
+    zipcode = kwargs["zipcode"]
+    return (
+        f"{FastAPICache.get_prefix()}:{zipcode}:{await cache_version(zipcode)}:s:{kwargs['street']}:"
+        f"{kwargs['limit']}:{kwargs['after_id']}"
+    )
+
+
+async def invalidate_cached_cameras(*zipcodes: str):
+    """Bump the cache version of the given zipcodes; a cache outage only logs, since the write already committed"""
+    backend = FastAPICache.get_backend()
+    try:
+        for zipcode in set(zipcodes):
+            await backend.set(cache_version_key(zipcode), uuid4().hex.encode())
+    except Exception:
+        logger.warning("Failed to invalidate cached cameras for zipcodes %s", sorted(set(zipcodes)), exc_info=True)
+
+
+def is_duplicate_intersection(exc: IntegrityError) -> bool:
+    """Whether an IntegrityError came from the one-camera-per-intersection unique index"""
+    message = str(exc.orig)
+    # PostgreSQL names the violated index; SQLite lists its columns instead
+    return "uq_camera_intersection" in message or (
+        "UNIQUE constraint failed: cameras.zipcode, cameras.cross_street_1, cameras.cross_street_2" in message
+    )
+
+
+async def fetch_camera_page(db: AsyncSession, stmt, limit: int, after_id: Optional[int]) -> CameraListResponse:
+    """Run a camera select as one keyset-paginated page"""
+    if after_id is not None:
+        stmt = stmt.where(CameraDB.id > after_id)
+    result = await db.execute(stmt.order_by(CameraDB.id).limit(limit + 1))
+    rows = result.mappings().all()
+
+    items = [dict(row) for row in rows[:limit]]
+    next_id = items[-1]["id"] if len(rows) > limit else None
+    return CameraListResponse({"items": items, "next": next_id})
 
 
 # Dependency to get DB session
-def get_db():
+async def get_db():
     """Database session dependency"""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-# Initialize with sample data
-@app.on_event("startup")
-def startup_event():
-    """Initialize database with sample data on startup"""
-    db = SessionLocal()
-    try:
-        # Check if data already exists
-        count = db.query(CameraDB).count()
-        if count == 0:
-            # Add sample data with accurate real-world locations
-            sample_cameras = [
-                CameraDB(
-                    cross_street_1="5th Ave",
-                    cross_street_2="W 42nd St",
-                    zipcode="10036",
-                    speed_limit=25,
-                    direction="N"
-                ),
-                CameraDB(
-                    cross_street_1="Broadway",
-                    cross_street_2="W 34th St",
-                    zipcode="10001",
-                    speed_limit=25,
-                    direction="S"
-                ),
-                CameraDB(
-                    cross_street_1="Park Ave",
-                    cross_street_2="E 59th St",
-                    zipcode="10022",
-                    speed_limit=30,
-                    direction="E"
-                ),
-                CameraDB(
-                    cross_street_1="Madison Ave",
-                    cross_street_2="E 72nd St",
-                    zipcode="10021",
-                    speed_limit=25,
-                    direction="W"
-                ),
-                CameraDB(
-                    cross_street_1="Wilshire Blvd",
-                    cross_street_2="S Beverly Dr",
-                    zipcode="90212",
-                    speed_limit=35,
-                    direction="W"
-                ),
-                CameraDB(
-                    cross_street_1="Sunset Blvd",
-                    cross_street_2="N Highland Ave",
-                    zipcode="90028",
-                    speed_limit=35,
-                    direction="E"
-                ),
-                CameraDB(
-                    cross_street_1="Michigan Ave",
-                    cross_street_2="E Randolph St",
-                    zipcode="60601",
-                    speed_limit=30,
-                    direction="N"
-                ),
-                CameraDB(
-                    cross_street_1="State St",
-                    cross_street_2="W Madison St",
-                    zipcode="60602",
-                    speed_limit=25,
-                    direction="S"
-                ),
-                CameraDB(
-                    cross_street_1="Market St",
-                    cross_street_2="5th St",
-                    zipcode="94103",
-                    speed_limit=25,
-                    direction="NE"
-                ),
-                CameraDB(
-                    cross_street_1="Lombard St",
-                    cross_street_2="Hyde St",
-                    zipcode="94133",
-                    speed_limit=15,
-                    direction="E"
-                ),
-            ]
-            db.add_all(sample_cameras)
-            db.commit()
-    finally:
-        db.close()
+# Routes
+# Constant bodies for the info and health endpoints, serialized once at import
+ROOT_BODY = orjson.dumps({
+    "message": "Speed Camera API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "openapi": "/openapi.json"
+})
+HEALTH_BODY = orjson.dumps({"status": "healthy"})
 
 
-# Routes
 @app.get("/", tags=["root"])
-def read_root():
+async def read_root():
     """Root endpoint with API information"""
-    return {
-        "message": "Speed Camera API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "openapi": "/openapi.json"
-    }
+    return Response(ROOT_BODY, media_type="application/json")
 
 
-@app.get("/cameras/zipcode/{zipcode}", response_model=List[Camera], tags=["cameras"])
-def get_cameras_by_zipcode(zipcode: str, db: Session = Depends(get_db)):
+@app.get("/cameras/zipcode/{zipcode}", response_model=CameraPage, tags=["cameras"])
+@cache(expire=CACHE_EXPIRE_SECONDS, key_builder=zipcode_cache_key)
+async def get_cameras_by_zipcode(
+        zipcode: ZipCode,
+        limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of cameras to return")] = 100,
+        after_id: Annotated[Optional[int], Query(description="Return cameras with an ID after this one")] = None,
+        db: AsyncSession = Depends(get_db)
+):
     """
-    Get all cameras in a specific zipcode.
+    Get cameras in a specific zipcode, one page at a time.
 
-    Returns an empty list if no cameras are found.
+    Returns an empty page if no cameras are found.
     """
-    if not zipcode.isdigit() or len(zipcode) != 5:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid zipcode format. Must be 5 digits."
-        )
-
-    cameras = db.query(CameraDB).filter(CameraDB.zipcode == zipcode).all()
-    return cameras
-
-
-@app.get("/cameras/search", response_model=List[Camera], tags=["cameras"])
-def search_cameras_by_street(
-        street: str = Query(..., description="Street name to search for", min_length=1),
-        zipcode: str = Query(..., pattern=r"^\d{5}$", description="5-digit zipcode"),
-        db: Session = Depends(get_db)
+    stmt = select(*CAMERA_COLUMNS).where(CameraDB.zipcode == zipcode)
+    return await fetch_camera_page(db, stmt, limit, after_id)
+
+
+@app.get("/cameras/search", response_model=CameraPage, tags=["cameras"])
+@cache(expire=CACHE_EXPIRE_SECONDS, key_builder=search_cache_key)
+async def search_cameras_by_street(
+        street: Annotated[str, Query(description="Street name to search for", min_length=1, max_length=100)],
+        zipcode: Annotated[ZipCode, Query(description="5-digit zipcode")],
+        limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of cameras to return")] = 100,
+        after_id: Annotated[Optional[int], Query(description="Return cameras with an ID after this one")] = None,
+        db: AsyncSession = Depends(get_db)
 ):
     """
-    Search cameras by street name and zipcode.
+    Search cameras by street name and zipcode, one page at a time.
 
     The street name is matched against both cross streets (case-insensitive).
-    Returns an empty list if no cameras are found.
+    Returns an empty page if no cameras are found.
     """
-    if not zipcode.isdigit() or len(zipcode) != 5:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid zipcode format. Must be 5 digits."
-        )
-
-    cameras = db.query(CameraDB).filter(
+    # Lowercase the pattern with the same SQL lower() that fills the _lc columns
+    pattern = func.lower(literal(f"%{escape_like(street)}%"))
+    stmt = select(*CAMERA_COLUMNS).where(
         CameraDB.zipcode == zipcode
-    ).filter(
-        (CameraDB.cross_street_1.ilike(f"%{street}%")) |
-        (CameraDB.cross_street_2.ilike(f"%{street}%"))
-    ).all()
-
-    return cameras
+    ).where(
+        or_(
+            CameraDB.cross_street_1_lc.like(pattern, escape="\\"),
+            CameraDB.cross_street_2_lc.like(pattern, escape="\\")
+        )
+    )
+    return await fetch_camera_page(db, stmt, limit, after_id)
 
 
 @app.post("/cameras", response_model=Camera, status_code=201, tags=["cameras"])
-def create_camera(camera: CameraCreate, db: Session = Depends(get_db)):
+async def create_camera(camera: CameraCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new speed camera.
 
     Prevents duplicate cameras at the same intersection (same cross streets and zipcode).
     """
-    # Check for duplicate
-    existing = db.query(CameraDB).filter(
-        CameraDB.cross_street_1 == camera.cross_street_1,
-        CameraDB.cross_street_2 == camera.cross_street_2,
-        CameraDB.zipcode == camera.zipcode
-    ).first()
-
-    if existing:
+    try:
+        result = await db.execute(
+            insert(CameraDB).values(**camera.model_dump()).returning(*CAMERA_COLUMNS)
+        )
+        db_camera = dict(result.mappings().one())
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if not is_duplicate_intersection(exc):
+            raise
         raise HTTPException(
             status_code=400,
             detail=(
@@ -284,58 +457,76 @@ def create_camera(camera: CameraCreate, db: Session = Depends(get_db)):
                 f"and {camera.cross_street_2} in zipcode {camera.zipcode}"
             )
         )
-
-    db_camera = CameraDB(**camera.model_dump())
-    db.add(db_camera)
-    db.commit()
-    db.refresh(db_camera)
+    await invalidate_cached_cameras(db_camera["zipcode"])
     return db_camera
 
 
 @app.put("/cameras/{camera_id}", response_model=Camera, tags=["cameras"])
-def update_camera(
+async def update_camera(
         camera_id: int,
         camera: CameraUpdate,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing camera.
 
     All fields except ID can be updated. Only provide fields you want to change.
     """
-    db_camera = db.query(CameraDB).filter(CameraDB.id == camera_id).first()
+    update_data = camera.model_dump(exclude_unset=True)
+    if not update_data:
+        # Nothing to change, so return the camera as stored
+        result = await db.execute(CAMERA_BY_ID, {"camera_id": camera_id})
+        db_camera = result.scalar_one_or_none()
+        if not db_camera:
+            raise HTTPException(status_code=404, detail="Camera not found")
+        return db_camera
+
+    old_zipcode = None
+    if "zipcode" in update_data:
+        # RETURNING only sees the new zipcode, so read the old one to invalidate its cached pages too
+        old_zipcode = await db.scalar(
+            select(CameraDB.zipcode).where(CameraDB.id == camera_id).with_for_update()
+        )
 
-    if not db_camera:
+    # Update only provided fields, getting the updated row back from the same statement
+    try:
+        result = await db.execute(
+            update(CameraDB).where(CameraDB.id == camera_id).values(**update_data).returning(*CAMERA_COLUMNS)
+        )
+        db_camera = result.mappings().one_or_none()
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if not is_duplicate_intersection(exc):
+            raise
+        raise HTTPException(status_code=400, detail="Camera already exists at this intersection")
+
+    if db_camera is None:
         raise HTTPException(status_code=404, detail="Camera not found")
 
-    # Update only provided fields
-    update_data = camera.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_camera, key, value)
-
-    db.commit()
-    db.refresh(db_camera)
-    return db_camera
+    await invalidate_cached_cameras(*filter(None, (old_zipcode, db_camera["zipcode"])))
+    return dict(db_camera)
 
 
 @app.delete("/cameras/{camera_id}", tags=["cameras"])
-def delete_camera(camera_id: int, db: Session = Depends(get_db)):
+async def delete_camera(camera_id: int, db: AsyncSession = Depends(get_db)):
     """
     Delete a camera by ID.
 
     This is a hard delete and cannot be undone.
     """
-    db_camera = db.query(CameraDB).filter(CameraDB.id == camera_id).first()
+    result = await db.execute(delete(CameraDB).where(CameraDB.id == camera_id).returning(CameraDB.zipcode))
+    deleted_zipcode = result.scalar_one_or_none()
+    await db.commit()
 
-    if not db_camera:
+    if deleted_zipcode is None:
         raise HTTPException(status_code=404, detail="Camera not found")
 
-    db.delete(db_camera)
-    db.commit()
+    await invalidate_cached_cameras(deleted_zipcode)
     return {"message": "Camera deleted successfully"}
 
 
 @app.get("/health", tags=["health"])
-def health_check():
+async def health_check():
     """Health check endpoint for monitoring"""
-    return {"status": "healthy"}
\ No newline at end of file
+    return Response(HEALTH_BODY, media_type="application/json")
\ No newline at end of file
@@ -0,0 +1,144 @@
+# seed.py
+"""
+One-shot database setup: creates the schema and loads sample data into an empty table.
+
+Run once per deploy, before starting the API workers:
+
+    python seed.py
+"""
+import asyncio
+import logging
+from sqlalchemy import Column, Computed, delete, func, insert, inspect, select, text
+from sqlalchemy.schema import CreateColumn
+
+from main import CAMERA_COLUMNS, Base, CameraDB, engine
+
+logger = logging.getLogger(__name__)
+
+
+def remove_duplicate_intersections(conn):
+    """Delete all but the lowest-ID camera at each intersection, logging every row removed"""
+    first_ids = select(func.min(CameraDB.id)).group_by(
+        CameraDB.zipcode, CameraDB.cross_street_1, CameraDB.cross_street_2
+    )
+    duplicates = conn.execute(
+        select(*CAMERA_COLUMNS).where(CameraDB.id.not_in(first_ids)).order_by(CameraDB.id)
+    ).mappings().all()
+    for row in duplicates:
+        logger.warning("Removing duplicate camera before adding uq_camera_intersection: %s", dict(row))
+    if duplicates:
+        conn.execute(delete(CameraDB).where(CameraDB.id.in_([row["id"] for row in duplicates])))
+
+
+def init_schema(conn):
+    """Create tables, plus any columns and indexes added after the table was first created"""
+    Base.metadata.create_all(conn)
+    inspector = inspect(conn)
+    existing_columns = {column["name"] for column in inspector.get_columns(CameraDB.__tablename__)}
+    existing_indexes = {index["name"] for index in inspector.get_indexes(CameraDB.__tablename__)}
+    for column in CameraDB.__table__.columns:
+        if column.name not in existing_columns:
+            if column.computed is not None and conn.dialect.name == "sqlite":
+                # SQLite can only add VIRTUAL generated columns to an existing table
+                column = Column(column.name, column.type, Computed(column.computed.sqltext, persisted=False))
+            column_ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {CameraDB.__tablename__} ADD COLUMN {column_ddl}"))
+    if "uq_camera_intersection" not in existing_indexes:
+        # Databases from before the unique index may already hold duplicate intersections
+        remove_duplicate_intersections(conn)
+    for index in CameraDB.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+
+# Sample data with accurate real-world locations, loaded into an empty database
+SAMPLE_ROWS = (
+    {
+        "cross_street_1": "5th Ave",
+        "cross_street_2": "W 42nd St",
+        "zipcode": "10036",
+        "speed_limit": 25,
+        "direction": "N"
+    },
+    {
+        "cross_street_1": "Broadway",
+        "cross_street_2": "W 34th St",
+        "zipcode": "10001",
+        "speed_limit": 25,
+        "direction": "S"
+    },
+    {
+        "cross_street_1": "Park Ave",
+        "cross_street_2": "E 59th St",
+        "zipcode": "10022",
+        "speed_limit": 30,
+        "direction": "E"
+    },
+    {
+        "cross_street_1": "Madison Ave",
+        "cross_street_2": "E 72nd St",
+        "zipcode": "10021",
+        "speed_limit": 25,
+        "direction": "W"
+    },
+    {
+        "cross_street_1": "Wilshire Blvd",
+        "cross_street_2": "S Beverly Dr",
+        "zipcode": "90212",
+        "speed_limit": 35,
+        "direction": "W"
+    },
+    {
+        "cross_street_1": "Sunset Blvd",
+        "cross_street_2": "N Highland Ave",
+        "zipcode": "90028",
+        "speed_limit": 35,
+        "direction": "E"
+    },
+    {
+        "cross_street_1": "Michigan Ave",
+        "cross_street_2": "E Randolph St",
+        "zipcode": "60601",
+        "speed_limit": 30,
+        "direction": "N"
+    },
+    {
+        "cross_street_1": "State St",
+        "cross_street_2": "W Madison St",
+        "zipcode": "60602",
+        "speed_limit": 25,
+        "direction": "S"
+    },
+    {
+        "cross_street_1": "Market St",
+        "cross_street_2": "5th St",
+        "zipcode": "94103",
+        "speed_limit": 25,
+        "direction": "NE"
+    },
+    {
+        "cross_street_1": "Lombard St",
+        "cross_street_2": "Hyde St",
+        "zipcode": "94133",
+        "speed_limit": 15,
+        "direction": "E"
+    },
+)
+
+
+async def seed():
+    """Create tables and indexes, then insert the sample cameras if the table is empty"""
+    async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(init_schema)
+
+        # Seed only when the table is empty
+        if (await conn.execute(select(CameraDB.id).limit(1))).first() is None:
+            await conn.execute(insert(CameraDB), list(SAMPLE_ROWS))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(seed())